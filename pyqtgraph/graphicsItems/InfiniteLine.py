@@ -3,6 +3,7 @@ from math import atan2, degrees
 import numpy as np
 
 from .. import functions as fn
+from .. import getConfigOption
 from ..Point import Point
 from ..Qt import QtCore, QtGui
 from .GraphicsItem import GraphicsItem
@@ -12,6 +13,10 @@ from .ViewBox import ViewBox
 
 __all__ = ['InfiniteLine', 'InfLineLabel']
 
+## shared constants; these are only ever read, never modified in place
+_ZERO = Point(0, 0)
+_UNIT_X = Point(1, 0)
+
 
 class InfiniteLine(GraphicsObject):
     """
@@ -68,6 +73,7 @@ class InfiniteLine(GraphicsObject):
         =============== ==================================================================
         """
         self._boundingRect = None
+        self._boundingRectKey = None
 
         self._name = name
 
@@ -84,7 +90,7 @@ class InfiniteLine(GraphicsObject):
         self.setAngle(angle)
 
         if pos is None:
-            pos = Point(0,0)
+            pos = _ZERO
         self.setPos(pos)
 
         if pen is None:
@@ -107,6 +113,7 @@ class InfiniteLine(GraphicsObject):
                 
         # Cache variables for managing bounds
         self._endPoints = [0, 1] # 
+        self._line = QtCore.QLineF(0, 0, 1, 0)
         self._bounds = None
         self._lastViewSize = None
         
@@ -133,6 +140,7 @@ class InfiniteLine(GraphicsObject):
         """Set the pen for drawing the line. Allowable arguments are any that are valid
         for :func:`mkPen <pyqtgraph.mkPen>`."""
         self.pen = fn.mkPen(*args, **kwargs)
+        self.pen.setJoinStyle(QtCore.Qt.PenJoinStyle.MiterJoin)
         if not self.mouseHovering:
             self.currentPen = self.pen
             self.update()
@@ -153,6 +161,7 @@ class InfiniteLine(GraphicsObject):
         self.hoverPen = fn.mkPen(*args, **kwargs)
         if not widthSpecified:
             self.hoverPen.setWidth(self.pen.width())
+        self.hoverPen.setJoinStyle(QtCore.Qt.PenJoinStyle.MiterJoin)
             
         if self.mouseHovering:
             self.currentPen = self.hoverPen
@@ -219,40 +228,50 @@ class InfiniteLine(GraphicsObject):
         not vertical or horizontal.
         """
         self.angle = angle #((angle+45) % 180) - 45   ##  -45 <= angle < 135
+        ## index of the coordinate reported by value(); None for oblique lines
+        if angle % 180 == 0:
+            self._valueIndex = 1
+        elif angle % 180 == 90:
+            self._valueIndex = 0
+        else:
+            self._valueIndex = None
         self.resetTransform()
         self.setRotation(self.angle)
         self.update()
 
     def setPos(self, pos):
-
-        if isinstance(pos, (list, tuple, np.ndarray)) and not np.ndim(pos) == 0:
-            newPos = list(pos)
-        elif isinstance(pos, QtCore.QPointF):
-            newPos = [pos.x(), pos.y()]
+        idx = self._valueIndex
+
+        # QPointF first: this is what mouseDragEvent passes on every mouse move
+        if isinstance(pos, QtCore.QPointF):
+            x, y = pos.x(), pos.y()
+        elif isinstance(pos, (list, tuple, np.ndarray)) and not np.ndim(pos) == 0:
+            x, y = pos[0], pos[1]
+        elif idx == 0:
+            x, y = pos, 0
+        elif idx == 1:
+            x, y = 0, pos
         else:
-            if self.angle == 90:
-                newPos = [pos, 0]
-            elif self.angle == 0:
-                newPos = [0, pos]
-            else:
-                raise Exception("Must specify 2D coordinate for non-orthogonal lines.")
+            raise Exception("Must specify 2D coordinate for non-orthogonal lines.")
 
         ## check bounds (only works for orthogonal lines)
-        if self.angle == 90:
-            if self.maxRange[0] is not None:
-                newPos[0] = max(newPos[0], self.maxRange[0])
-            if self.maxRange[1] is not None:
-                newPos[0] = min(newPos[0], self.maxRange[1])
-        elif self.angle == 0:
-            if self.maxRange[0] is not None:
-                newPos[1] = max(newPos[1], self.maxRange[0])
-            if self.maxRange[1] is not None:
-                newPos[1] = min(newPos[1], self.maxRange[1])
-
-        if self.p != newPos:
-            self.p = newPos
+        if idx is not None:
+            lo, hi = self.maxRange
+            v = y if idx else x
+            if lo is not None and lo > v:
+                v = lo
+            if hi is not None and hi < v:
+                v = hi
+            if idx:
+                y = v
+            else:
+                x = v
+
+        p = self.p
+        if x != p[0] or y != p[1]:
+            self.p = [x, y]
             self.viewTransformChanged()
-            GraphicsObject.setPos(self, Point(self.p))
+            GraphicsObject.setPos(self, float(x), float(y))
             self.sigPositionChanged.emit(self)
 
     def getXPos(self):
@@ -267,9 +286,10 @@ class InfiniteLine(GraphicsObject):
     def value(self):
         """Return the value of the line. Will be a single number for horizontal and
         vertical lines, and a list of [x,y] values for diagonal lines."""
-        if self.angle%180 == 0:
+        idx = self._valueIndex
+        if idx == 1:
             return self.getYPos()
-        elif self.angle%180 == 90:
+        elif idx == 0:
             return self.getXPos()
         else:
             return self.getPos()
@@ -303,10 +323,19 @@ class InfiniteLine(GraphicsObject):
         
         ## add a 4-pixel radius around the line for mouse interaction.
         
-        px = self.pixelLength(direction=Point(1,0), ortho=True)  ## get pixel length orthogonal to the line
+        px = self.pixelLength(direction=_UNIT_X, ortho=True)  ## get pixel length orthogonal to the line
         if px is None:
             px = 0
         pw = max(self.pen.width() / 2, self.hoverPen.width() / 2)
+        vs = self.getViewBox().size()
+
+        ## skip rebuilding the rect if nothing it depends on has changed
+        key = (vr.left(), vr.right(), px, pw,
+               self._maxMarkerSize, self.span, vs.width(), vs.height())
+        if key == self._boundingRectKey:
+            return self._bounds
+        self._boundingRectKey = key
+
         w = max(4, self._maxMarkerSize + pw) + 1
         w = w * px
         br = QtCore.QRectF(vr)
@@ -320,14 +349,13 @@ class InfiniteLine(GraphicsObject):
         br.setRight(right)
         br = br.normalized()
         
-        vs = self.getViewBox().size()
-        
         if self._bounds != br or self._lastViewSize != vs:
             self._bounds = br
             self._lastViewSize = vs
             self.prepareGeometryChange()
         
         self._endPoints = (left, right)
+        self._line = QtCore.QLineF(left, 0, right, 0)
         self._lastViewRect = vr
         
         return self._bounds
@@ -338,18 +366,23 @@ class InfiniteLine(GraphicsObject):
         return self._boundingRect
 
     def paint(self, p, *args):
-        p.setRenderHint(p.RenderHint.Antialiasing)
+        # thin horizontal and vertical lines look the same without antialiasing,
+        # which is considerably cheaper to draw, so they are only antialiased
+        # when the global option asks for it
+        if (self._valueIndex is None or self.currentPen.widthF() > 1 or
+                getConfigOption('antialias') is True):
+            p.setRenderHint(p.RenderHint.Antialiasing)
         
         left, right = self._endPoints
-        pen = self.currentPen
-        pen.setJoinStyle(QtCore.Qt.PenJoinStyle.MiterJoin)
-        p.setPen(pen)
-        p.drawLine(Point(left, 0), Point(right, 0))
+        p.setPen(self.currentPen)
+        p.drawLine(self._line)
         
         
         if len(self.markers) == 0:
             return
         
+        p.setRenderHint(p.RenderHint.Antialiasing)
+
         # paint markers in native coordinate system
         tr = p.transform()
         p.resetTransform()
@@ -476,12 +509,22 @@ class InfLineLabel(TextItem):
     """
     def __init__(self, line, text="", movable=False, position=0.5, anchors=None, **kwds):
         self.line = line
+        self._lineValue = line.value  # bound once; called on every line move
         self.movable = movable
         self.moving = False
+        self._moving = False
         self.orthoPos = position  # text will always be placed on the line at a position relative to view bounds
         self.format = text
-        self.line.sigPositionChanged.connect(self.valueChanged)
+        ## while the line is dragged, reformat the label once per pass of the
+        ## event loop rather than once per mouse sample
+        self._valueChangedTimer = QtCore.QTimer()
+        self._valueChangedTimer.setSingleShot(True)
+        self._valueChangedTimer.timeout.connect(self.valueChanged)
+        self.line.sigPositionChanged.connect(self._lineMoved)
+        self.line.sigPositionChangeFinished.connect(self._lineMoveFinished)
         self._endpoints = (None, None)
+        self._intersectKey = None     # cached intersection of an oblique line with the view
+        self._intersectPoints = None
         if anchors is None:
             # automatically pick sensible anchors
             rax = kwds.get('rotateAxis', None)
@@ -504,10 +547,24 @@ class InfLineLabel(TextItem):
     def valueChanged(self):
         if not self.isVisible():
             return
-        value = self.line.value()
+        value = self._lineValue()
         self.setText(self.format.format(value=value))
+        self._endpoints = (None, None)
         self.updatePosition()
 
+    def _lineMoved(self):
+        if self.line.moving:
+            self._valueChangedTimer.start(0)
+        else:
+            self._valueChangedTimer.stop()
+            self.valueChanged()
+
+    def _lineMoveFinished(self):
+        ## apply a label update still pending from the drag
+        if self._valueChangedTimer.isActive():
+            self._valueChangedTimer.stop()
+            self.valueChanged()
+
     def getEndpoints(self):
         # calculate points where line intersects view box
         # (in line coordinates)
@@ -522,28 +579,42 @@ class InfLineLabel(TextItem):
                 if not self.isVisible() or not isinstance(view, ViewBox):
                     # not in a viewbox, skip update
                     return (None, None)
-                p = QtGui.QPainterPath()
-                p.moveTo(pt1)
-                p.lineTo(pt2)
-                p = self.line.itemTransform(view)[0].map(p)
-                vr = QtGui.QPainterPath()
-                vr.addRect(view.boundingRect())
-                paths = vr.intersected(p).toSubpathPolygons(QtGui.QTransform())
-                if len(paths) > 0:
-                    l = list(paths[0])
-                    pt1 = self.line.mapFromItem(view, l[0])
-                    pt2 = self.line.mapFromItem(view, l[1])
+                tr = self.line.itemTransform(view)[0]
+                vb = view.boundingRect()
+                # the intersection only depends on where the line sits in the view;
+                # skip it if that did not change (eg. the view was only repainted)
+                key = (tr, vb, lr.left(), lr.right())
+                if key == self._intersectKey:
+                    pt1, pt2 = self._intersectPoints
+                else:
+                    p = QtGui.QPainterPath()
+                    p.moveTo(pt1)
+                    p.lineTo(pt2)
+                    p = tr.map(p)
+                    vr = QtGui.QPainterPath()
+                    vr.addRect(vb)
+                    paths = vr.intersected(p).toSubpathPolygons(QtGui.QTransform())
+                    if len(paths) > 0:
+                        l = list(paths[0])
+                        pt1 = self.line.mapFromItem(view, l[0])
+                        pt2 = self.line.mapFromItem(view, l[1])
+                    self._intersectKey = key
+                    self._intersectPoints = (pt1, pt2)
             self._endpoints = (pt1, pt2)
         return self._endpoints
     
     def updatePosition(self):
         # update text position to relative view location along line
-        self._endpoints = (None, None)
+        if not self._moving:
+            # while dragging the label, neither the line nor the view moves, so the
+            # endpoints are kept (valueChanged and viewTransformChanged reset them)
+            self._endpoints = (None, None)
         pt1, pt2 = self.getEndpoints()
         if pt1 is None:
             return
-        pt = pt2 * self.orthoPos + pt1 * (1-self.orthoPos)
-        self.setPos(pt)
+        # plain float math; Point arithmetic is comparatively slow here
+        f = self.orthoPos
+        self.setPos(pt2.x() * f + pt1.x() * (1 - f), pt2.y() * f + pt1.y() * (1 - f))
         
         # update anchor to keep text visible as it nears the view box edge
         vr = self.line.viewRect()
@@ -584,6 +655,7 @@ class InfLineLabel(TextItem):
         if self.movable and ev.button() == QtCore.Qt.MouseButton.LeftButton:
             if ev.isStart():
                 self._moving = True
+                self._endpoints = (None, None)
                 self._cursorOffset = self._posToRel(ev.buttonDownPos())
                 self._startPosition = self.orthoPos
             ev.accept()
@@ -609,6 +681,7 @@ class InfLineLabel(TextItem):
 
     def viewTransformChanged(self):
         GraphicsItem.viewTransformChanged(self)
+        self._endpoints = (None, None)
         self.updatePosition()
         TextItem.viewTransformChanged(self)
 
@@ -617,6 +690,5 @@ class InfLineLabel(TextItem):
         pt1, pt2 = self.getEndpoints()
         if pt1 is None:
             return 0
-        view = self.getViewBox()
         pos = self.mapToParent(pos)
         return (pos.x() - pt1.x()) / (pt2.x()-pt1.x())
@@ -3,6 +3,7 @@ from math import atan2, degrees
 from .. import functions as fn
 from ..Point import Point
 from ..Qt import QtCore, QtGui, QtWidgets
+from .GraphicsItem import LRU
 from .GraphicsObject import GraphicsObject
 
 __all__ = ['TextItem']
@@ -11,6 +12,10 @@ class TextItem(GraphicsObject):
     """
     GraphicsItem displaying unscaled text (the text will always appear normal even inside a scaled ViewBox). 
     """
+
+    ## inverted and rotated parent transforms (translation removed) shared by all text items
+    _transformCache = LRU(100)
+
     def __init__(self, text='', color=(200,200,200), html=None, anchor=(0,0),
                  border=None, fill=None, angle=0, rotateAxis=None):
         """
@@ -50,8 +55,13 @@ class TextItem(GraphicsObject):
         self.textItem = QtWidgets.QGraphicsTextItem()
         self.textItem.setParentItem(self)
         self._lastTransform = None
-        self._lastScene = None
         self._bounds = QtCore.QRectF()
+        self._plainText = True
+        self._staticText = None
+        self._settingText = False
+        self.textItem.document().contentsChanged.connect(self._textItemChanged)
+        # re-anchoring the text is deferred; see _invalidateTextPos()
+        self._textPosDirty = True
         if html is None:
             self.setColor(color)
             self.setText(text)
@@ -60,6 +70,7 @@ class TextItem(GraphicsObject):
         self.fill = fn.mkBrush(fill)
         self.border = fn.mkPen(border)
         self.setAngle(angle)
+        self._updateTextPosIfDirty()
 
     def setText(self, text, color=None):
         """
@@ -78,8 +89,12 @@ class TextItem(GraphicsObject):
         See QtWidgets.QGraphicsTextItem.setPlainText().
         """
         if text != self.toPlainText():
+            self._settingText = True
             self.textItem.setPlainText(text)
-            self.updateTextPos()
+            self._settingText = False
+            self._plainText = True
+            self._updateStaticText()
+            self._invalidateTextPos()
 
     def toPlainText(self):
         return self.textItem.toPlainText()
@@ -91,8 +106,12 @@ class TextItem(GraphicsObject):
         See QtWidgets.QGraphicsTextItem.setHtml().
         """
         if self.toHtml() != html:
+            self._settingText = True
             self.textItem.setHtml(html)
-            self.updateTextPos()
+            self._settingText = False
+            self._plainText = False
+            self._updateStaticText()
+            self._invalidateTextPos()
         
     def toHtml(self):
         return self.textItem.toHtml()
@@ -107,7 +126,8 @@ class TextItem(GraphicsObject):
         See QtWidgets.QGraphicsTextItem.setTextWidth().
         """
         self.textItem.setTextWidth(*args)
-        self.updateTextPos()
+        self._updateStaticText()
+        self._invalidateTextPos()
         
     def setFont(self, *args):
         """
@@ -116,7 +136,7 @@ class TextItem(GraphicsObject):
         See QtWidgets.QGraphicsTextItem.setFont().
         """
         self.textItem.setFont(*args)
-        self.updateTextPos()
+        self._invalidateTextPos()
         
     def setAngle(self, angle):
         """
@@ -130,8 +150,10 @@ class TextItem(GraphicsObject):
         self.updateTransform(force=True)
 
     def setAnchor(self, anchor):
-        self.anchor = Point(anchor)
-        self.updateTextPos()
+        anchor = Point(anchor)
+        if anchor != self.anchor:
+            self.anchor = anchor
+            self._invalidateTextPos()
 
     def setColor(self, color):
         """
@@ -141,9 +163,54 @@ class TextItem(GraphicsObject):
         """
         self.color = fn.mkColor(color)
         self.textItem.setDefaultTextColor(self.color)
+        self.update()
         
+    def _updateStaticText(self):
+        # Plain, single-line text is drawn in paint() from a cached QStaticText;
+        # the QGraphicsTextItem is then hidden and only used for layout, which
+        # saves rendering its document on every paint. Rich, wrapped,
+        # multi-line or editable text is still painted by the QGraphicsTextItem
+        # itself.
+        text = self.textItem.toPlainText()
+        if self._plainText and self._textItemIsStatic() and text.isprintable():
+            st = QtGui.QStaticText(text)
+            st.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            self._staticText = st
+            self.textItem.setVisible(False)
+        else:
+            self._staticText = None
+            self.textItem.setVisible(True)
+
+    def _textItemIsStatic(self):
+        # wrapping and text interaction may also be set up directly on textItem
+        ti = self.textItem
+        return (ti.textWidth() < 0 and
+                ti.textInteractionFlags() == QtCore.Qt.TextInteractionFlag.NoTextInteraction)
+
+    def _textItemChanged(self):
+        # The text was edited directly through self.textItem. It may be rich
+        # text, so stop using the static text and let textItem paint itself.
+        if self._settingText:
+            return
+        self._plainText = False
+        self._updateStaticText()
+        self.update()
+
+    def _invalidateTextPos(self):
+        # Setters only flag the text position as stale; it is recomputed once on
+        # the next paint, geometry query or transform update, so that changing
+        # text, font and anchor in a row re-anchors the text a single time.
+        if not self._textPosDirty:
+            self.prepareGeometryChange()
+            self._textPosDirty = True
+
+    def _updateTextPosIfDirty(self):
+        if self._textPosDirty:
+            self.updateTextPos()
+
     def updateTextPos(self):
         # update text position to obey anchor
+        self._textPosDirty = False
         r = self.textItem.boundingRect()
         tl = self.textItem.mapToParent(r.topLeft())
         br = self.textItem.mapToParent(r.bottomRight())
@@ -152,6 +219,7 @@ class TextItem(GraphicsObject):
 
         
     def boundingRect(self):
+        self._updateTextPosIfDirty()
         return self.textItem.mapRectToParent(self.textItem.boundingRect())
 
     def viewTransformChanged(self):
@@ -159,25 +227,40 @@ class TextItem(GraphicsObject):
         # Do this here to avoid double-updates when view changes.
         self.updateTransform()
         
-    def paint(self, p, *args):
-        # this is not ideal because it requires the transform to be updated at every draw.
-        # ideally, we would have a sceneTransformChanged event to react to..
-        s = self.scene()
-        ls = self._lastScene
-        if s is not ls:
-            if ls is not None:
-                ls.sigPrepareForPaint.disconnect(self.updateTransform)
-            self._lastScene = s
-            if s is not None:
-                s.sigPrepareForPaint.connect(self.updateTransform)
+    def itemChange(self, change, value):
+        # keep the transform up to date as the item moves between scenes and
+        # parents, so that paint() never has to recompute it.
+        ret = super().itemChange(change, value)
+        if change == self.GraphicsItemChange.ItemSceneChange:
+            scene = self.scene()
+            if scene is not None and hasattr(scene, 'sigPrepareForPaint'):
+                scene.sigPrepareForPaint.disconnect(self.updateTransform)
+        elif change == self.GraphicsItemChange.ItemSceneHasChanged:
+            scene = self.scene()
+            if scene is not None and hasattr(scene, 'sigPrepareForPaint'):
+                scene.sigPrepareForPaint.connect(self.updateTransform)
             self.updateTransform()
-            p.setTransform(self.sceneTransform())
-        
+        elif change == self.GraphicsItemChange.ItemParentHasChanged:
+            self.updateTransform()
+        return ret
+
+    def paint(self, p, *args):
+        self._updateTextPosIfDirty()
         if self.border.style() != QtCore.Qt.PenStyle.NoPen or self.fill.style() != QtCore.Qt.BrushStyle.NoBrush:
             p.setPen(self.border)
             p.setBrush(self.fill)
             p.setRenderHint(p.RenderHint.Antialiasing, True)
             p.drawPolygon(self.textItem.mapToParent(self.textItem.boundingRect()))
+
+        if self._staticText is not None and not self._textItemIsStatic():
+            # textItem was made to wrap or accept input; let it paint itself
+            self._updateStaticText()
+
+        if self._staticText is not None:
+            margin = self.textItem.document().documentMargin()
+            p.setFont(self.textItem.font())
+            p.setPen(self.textItem.defaultTextColor())
+            p.drawStaticText(self.textItem.pos() + QtCore.QPointF(margin, margin), self._staticText)
         
     def setVisible(self, v):
         GraphicsObject.setVisible(self, v)
@@ -200,19 +283,28 @@ class TextItem(GraphicsObject):
             pt = p.sceneTransform()
         
         if not force and pt == self._lastTransform:
+            self._updateTextPosIfDirty()
             return
 
-        t = pt.inverted()[0]
-        # reset translation
-        t.setMatrix(t.m11(), t.m12(), t.m13(), t.m21(), t.m22(), t.m23(), 0, 0, t.m33())
-        
-        # apply rotation
+        # rotation to apply
         angle = -self.angle
         if self.rotateAxis is not None:
             d = pt.map(self.rotateAxis) - pt.map(Point(0, 0))
             a = degrees(atan2(d.y(), d.x()))
             angle += a
-        t.rotate(angle)  
+
+        # translation is discarded below, so for affine transforms the remaining
+        # terms and the angle are enough to identify the final transform
+        key = (pt.m11(), pt.m12(), pt.m13(), pt.m21(), pt.m22(), pt.m23(), pt.m33(), angle)
+        if not pt.isAffine():
+            key += (pt.m31(), pt.m32())
+        t = self._transformCache.get(key, None)
+        if t is None:
+            t = pt.inverted()[0]
+            # reset translation
+            t.setMatrix(t.m11(), t.m12(), t.m13(), t.m21(), t.m22(), t.m23(), 0, 0, t.m33())
+            t.rotate(angle)
+            self._transformCache[key] = t
         self.setTransform(t)
         self._lastTransform = pt
         self.updateTextPos()
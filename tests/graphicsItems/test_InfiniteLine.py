@@ -21,6 +21,7 @@ def test_InfiniteLine():
 
     vline = plt.addLine(x=1)
     assert vline.angle == 90
+    assert vline.rotation() == 90
     br = vline.mapToView(QtGui.QPolygonF(vline.boundingRect()))
     assert br.containsPoint(pg.Point(1, 5), QtCore.Qt.FillRule.OddEvenFill)
     assert not br.containsPoint(pg.Point(5, 0), QtCore.Qt.FillRule.OddEvenFill)
@@ -38,6 +39,7 @@ def test_InfiniteLine():
     plt.addItem(oline)
     oline.setPos(pg.Point(1, -1))
     assert oline.angle == 30
+    assert oline.rotation() == 30
     assert oline.pos() == pg.Point(1, -1)
     assert oline.value() == [1, -1]
 
@@ -97,3 +99,101 @@ def test_mouseInteraction():
     mouseDrag(plt, pos, pos2, QtCore.Qt.MouseButton.LeftButton)
     assert hline2.value() == -1
     plt.close()
+
+
+def test_InfiniteLine_boundingRectCache():
+    plt = pg.plot()
+    plt.resize(400, 300)
+    plt.setXRange(-10, 10, padding=0)
+    plt.setYRange(-10, 10, padding=0)
+    line = pg.InfiniteLine(pos=0, movable=True)
+    plt.addItem(line)
+    pg.QtWidgets.QApplication.processEvents()
+
+    br = line.boundingRect()
+    key = line._boundingRectKey
+    assert key is not None
+
+    # dragging along the view does not change anything the rect depends on
+    for x in (1, 2.5, -3):
+        line.setValue(x)
+        assert line.boundingRect() == br
+        assert line._boundingRectKey == key
+
+    # resizing the view changes the pixel size, so the rect is rebuilt
+    plt.resize(600, 450)
+    pg.QtWidgets.QApplication.processEvents()
+    line.boundingRect()
+    assert line._boundingRectKey != key
+    plt.close()
+
+
+def test_InfLineLabel_drag():
+    # disable delay of mouse move events because events is called immediately in test
+    pg.setConfigOption('mouseRateLimit', -1)
+
+    plt = pg.plot()
+    plt.scene().minDragTime = 0  # let us simulate mouse drags very quickly.
+    plt.setXRange(-10, 10)
+    plt.setYRange(-10, 10)
+    vline = plt.addLine(x=0, label='{value}', labelOpts={'movable': True, 'position': 0.5})
+    label = vline.label
+    QtTest.QTest.qWait(100)
+
+    # drag the label up along the line, toward the top of the view
+    pos = label.mapToScene(label.boundingRect().center())
+    pos2 = pos - QtCore.QPointF(0, 50)
+    mouseMove(plt, pos)
+    mouseDrag(plt, pos, pos2, QtCore.Qt.MouseButton.LeftButton)
+    assert label.orthoPos > 0.5
+
+    # label position must follow the line endpoints
+    pt1, pt2 = label.getEndpoints()
+    expected = pt2 * label.orthoPos + pt1 * (1 - label.orthoPos)
+    assert abs(label.pos().x() - expected.x()) < 1e-9
+    assert abs(label.pos().y() - expected.y()) < 1e-9
+    plt.close()
+
+
+def test_InfiniteLine_bounds():
+    vline = pg.InfiniteLine(pos=0, angle=90, bounds=[-1, 1])
+    vline.setValue(5)
+    assert vline.value() == 1
+    vline.setValue(-5)
+    assert vline.value() == -1
+
+    # lines turned by 180 degrees keep their orientation
+    hline = pg.InfiniteLine(pos=0, angle=180, bounds=[-1, 1])
+    hline.setValue(5)
+    assert hline.value() == 1
+    assert hline.getPos() == [0, 1]
+
+    oline = pg.InfiniteLine(pos=(1, 2), angle=30, bounds=[-1, 1])
+    assert oline.value() == [1, 2]
+
+
+def test_InfLineLabel_dragCoalescesUpdates():
+    line = pg.InfiniteLine(pos=0, movable=True, label='{value:0.1f}')
+    label = line.label
+    emitted = []
+    line.sigPositionChanged.connect(lambda l: emitted.append(l.value()))
+
+    # outside of a drag, the label follows every change
+    line.setValue(1)
+    assert label.toPlainText() == '1.0'
+
+    # during a drag, the signal stays synchronous but the label is
+    # reformatted once per event loop pass
+    line.moving = True
+    line.setValue(2)
+    line.setValue(3)
+    assert emitted == [1, 2, 3]
+    assert label.toPlainText() == '1.0'
+    QtTest.QTest.qWait(10)
+    assert label.toPlainText() == '3.0'
+
+    # a pending update is applied when the drag finishes
+    line.setValue(4)
+    line.moving = False
+    line.sigPositionChangeFinished.emit(line)
+    assert label.toPlainText() == '4.0'
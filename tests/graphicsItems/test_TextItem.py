@@ -20,3 +20,146 @@ def test_TextItem_setAngle():
     assert t1 != t2
     assert not t1.isRotating()
     assert t2.isRotating()
+
+
+def test_TextItem_sharedTransformCache():
+    plt = pg.plot()
+    plt.setXRange(-10, 10)
+    plt.setYRange(-20, 20)
+    item1 = pg.TextItem(text="test")
+    item2 = pg.TextItem(text="test", angle=45)
+    plt.addItem(item1)
+    plt.addItem(item2)
+    app.processEvents()
+
+    # same parent transform, but the rotation must not be shared
+    assert item1.transform() != item2.transform()
+    assert not item1.transform().isRotating()
+    assert item2.transform().isRotating()
+
+    item1.setAngle(45)
+    assert item1.transform() == item2.transform()
+    plt.close()
+
+
+def test_TextItem_staticText():
+    plt = pg.plot()
+    item = pg.TextItem(text="plain")
+    plt.addItem(item)
+    app.processEvents()
+    # plain single-line text is painted by the TextItem itself
+    assert not item.textItem.isVisible()
+
+    item.setHtml("<b>rich</b>")
+    assert item.textItem.isVisible()
+    item.setText("plain again")
+    assert not item.textItem.isVisible()
+    item.setText("two\nlines")
+    assert item.textItem.isVisible()
+    item.setText("one line")
+    item.setTextWidth(20)
+    assert item.textItem.isVisible()
+    item.setTextWidth(-1)
+    assert not item.textItem.isVisible()
+
+    # the hidden textItem still provides the layout
+    assert item.boundingRect().width() > 0
+
+    # direct edits of textItem are painted by textItem itself
+    item.textItem.setPlainText("direct")
+    assert item.textItem.isVisible()
+    item.setText("plain")
+    assert not item.textItem.isVisible()
+
+    # wrapping set up directly on textItem is painted by textItem itself
+    item.setText("a fairly long label text")
+    assert not item.textItem.isVisible()
+    item.textItem.setTextWidth(30)
+    plt.grab()
+    assert item.textItem.isVisible()
+    item.setTextWidth(-1)
+    assert not item.textItem.isVisible()
+
+    # so is editable text, which needs textItem to receive focus and mouse events
+    item.textItem.setTextInteractionFlags(pg.QtCore.Qt.TextInteractionFlag.TextEditorInteraction)
+    plt.grab()
+    assert item.textItem.isVisible()
+    plt.grab()
+    plt.close()
+
+
+def test_TextItem_deferredTextPos():
+    item = pg.TextItem(text="test", anchor=(1, 1))
+    calls = []
+    updateTextPos = item.updateTextPos
+    def countingUpdate():
+        calls.append(None)
+        updateTextPos()
+    item.updateTextPos = countingUpdate
+
+    # several changes in a row re-anchor the text only once
+    item.setText("a longer text")
+    item.setFont(pg.QtGui.QFont("", 20))
+    item.setAnchor((0.5, 0.5))
+    assert calls == []
+
+    # geometry queries see the up-to-date position
+    br = item.boundingRect()
+    assert len(calls) == 1
+    assert br.center() == pg.QtCore.QPointF(0, 0)
+    item.boundingRect()
+    assert len(calls) == 1
+
+
+def test_TextItem_sceneChanges():
+    def assertUnscaled(item):
+        # the item transform cancels the scale of everything above it
+        st = item.sceneTransform()
+        for v, expected in ((st.m11(), 1), (st.m12(), 0), (st.m21(), 0), (st.m22(), 1)):
+            assert abs(v - expected) < 1e-6
+
+    def receivers(scene):
+        return scene.receivers(scene.sigPrepareForPaint)
+
+    plt1 = pg.plot()
+    plt1.setXRange(0, 10)
+    plt1.setYRange(0, 1)
+    plt2 = pg.plot()
+    plt2.setXRange(0, 1000)
+    plt2.setYRange(-500, 500)
+    app.processEvents()
+    item = pg.TextItem(text="test")
+
+    # a plain QGraphicsScene has no sigPrepareForPaint
+    scene = pg.QtWidgets.QGraphicsScene()
+    scene.addItem(item)
+    assert item.transform() == pg.QtGui.QTransform()
+    scene.removeItem(item)
+
+    n1, n2 = receivers(plt1.scene()), receivers(plt2.scene())
+    plt1.addItem(item)
+    assertUnscaled(item)
+    t1 = item.transform()
+    assert receivers(plt1.scene()) == n1 + 1
+
+    # moving to another plot disconnects from the first scene
+    plt1.removeItem(item)
+    assert receivers(plt1.scene()) == n1
+    plt2.addItem(item)
+    assert receivers(plt2.scene()) == n2 + 1
+    assertUnscaled(item)
+    assert item.transform() != t1
+    t2 = item.transform()
+
+    # a new, scaled parent in the same scene
+    parent = pg.QtWidgets.QGraphicsRectItem()
+    parent.setScale(3)
+    plt2.addItem(parent)
+    item.setParentItem(parent)
+    assertUnscaled(item)
+    assert item.transform() != t2
+    assert receivers(plt2.scene()) == n2 + 1
+
+    plt2.grab()
+    plt1.close()
+    plt2.close()